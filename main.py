@@ -1,22 +1,187 @@
+import asyncio
 import json
 import logging
+import re
+import sys
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, Any, List
 from examples import SAMPLE_JSON
 
-# Import MCP library
-from mcp.server import FastMCP
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger("quicktype-mcp")
 
-# Create the MCP server
-mcp = FastMCP(name="quicktype-mcp")
+# Use orjson for parsing JSON when it is installed. orjson turns integers that
+# do not fit in 64 bits into floats, so text with a run of 19+ digits is parsed
+# by the json module instead; text orjson rejects (NaN, Infinity, lone
+# surrogates, ...) is re-parsed by the json module too, so results and error
+# messages never depend on whether orjson is installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_RE_LONG_DIGITS = re.compile(r"\d{19}")
+
+
+def _loads(json_text):
+    """Parse JSON text, with orjson when it is installed and gives the same result"""
+    if orjson is not None and not _RE_LONG_DIGITS.search(json_text):
+        try:
+            return orjson.loads(json_text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(json_text)
+
+
+def _dumps_indent(obj):
+    """Format parsed JSON with 2-space indentation, keeping non-ASCII characters
+    
+    The json module is used even when orjson is installed: orjson formats some
+    floats differently (0.00001 vs 1e-05) and cannot write NaN or big integers.
+    """
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def configure_logging() -> None:
+    """Configure logging for the server process (not done at import time)"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+
+# Tokens fix_json repairs, matched in a single left-to-right pass. Strings are
+# matched first so that quotes, commas and words inside them are left alone.
+# An unterminated string runs to the end of the input; otherwise a truncated
+# string would be rescanned from every escaped quote inside it.
+_RE_JSON_REPAIR = re.compile(r"""
+    (?P<string>"(?:[^"\\]|\\.)*(?:"|\\?\Z))     # double-quoted string: keep
+  | (?P<single>'(?P<single_body>(?:[^'\\]|\\.)*)(?:'|\\?\Z))  # single-quoted string: re-quote
+  | (?P<prefix>[{,]\s*)(?P<key>[A-Za-z0-9_$]+)(?=\s*:)  # unquoted key: quote
+  | ,(?P<trailing>)(?=\s*[}\]])                 # trailing comma: drop
+  | (?P<value_prefix>[:\[,]\s*)(?P<word>[A-Za-z_$][\w$]*)  # bare word value: quote
+""", re.VERBOSE)
+_RE_SINGLE_QUOTED_ESCAPE = re.compile(r'\\.|"')
+_JSON_LITERALS = frozenset(("true", "false", "null"))
+
+
+def _requote_escape(match):
+    """Translate one escape or double quote from a single-quoted string body"""
+    token = match.group()
+    if token == '"':
+        return '\\"'
+    if token == "\\'":
+        return "'"
+    return token
+
+
+def _repair_token(match):
+    """Return the replacement for one token matched by _RE_JSON_REPAIR"""
+    kind = match.lastgroup
+    if kind == "string":
+        return match.group()
+    if kind == "single":
+        body = _RE_SINGLE_QUOTED_ESCAPE.sub(_requote_escape, match.group("single_body"))
+        # Keep an unterminated string unterminated (and any trailing backslash)
+        end = match.string[match.end("single_body"):match.end()]
+        return f'"{body}"' if end == "'" else f'"{body}{end}'
+    if kind == "key":
+        return f'{match.group("prefix")}"{match.group("key")}"'
+    if kind == "trailing":
+        return ""
+    word = match.group("word")
+    if word in _JSON_LITERALS:
+        return match.group()
+    return f'{match.group("value_prefix")}"{word}"'
+
+
+def _repair_json(json_input):
+    """Fix common JSON mistakes in one pass over the input
+    
+    Handles single-quoted strings, unquoted keys, unquoted string values and
+    trailing commas in objects and arrays. Text inside double-quoted strings
+    is never modified.
+    """
+    return _RE_JSON_REPAIR.sub(_repair_token, json_input)
+
+
+def _repair_and_parse(json_input):
+    """Repair a JSON string and parse the result
+    
+    Returns:
+        A `(fixed_json, parsed_json)` tuple
+    
+    Raises:
+        json.JSONDecodeError: If the repaired JSON still does not parse
+    """
+    fixed_json = _repair_json(json_input)
+    return fixed_json, _loads(fixed_json)
+
 
+# Dart types for JSON values as (nullable, non-nullable), keyed by exact
+# Python type so that bool is never mistaken for int
+_DART_TYPES = {
+    bool: ('bool?', 'bool'),
+    int: ('int?', 'int'),
+    float: ('double?', 'double'),
+    str: ('String?', 'String'),
+    dict: ('Map<String, dynamic>?', 'Map<String, dynamic>'),
+}
+
+
+@lru_cache(maxsize=4096)
+def _pascal_case(key):
+    """Convert a JSON key to a PascalCase class-name fragment (cached, keys repeat a lot)"""
+    return key.title().replace('_', '')
+
+
+# Substrings of a lower-cased key that mark it as holding a date/time
+_DATE_KEY_TOKENS = ("date", "time", "created", "updated")
+
+# Length bounds of a DateTime value, from "YYYY-MM-DD" up to an ISO 8601
+# timestamp with fractional seconds and a UTC offset
+_MIN_DATETIME_LEN = 10
+_MAX_DATETIME_LEN = 40
+
+
+@lru_cache(maxsize=4096)
+def _is_date_key(json_key):
+    """Check whether a JSON key looks like a date/time field (cached per key)"""
+    key = json_key.lower()
+    return any(token in key for token in _DATE_KEY_TOKENS)
+
+
+# Limits on the JSON a model is generated from, so that hostile input fails
+# fast instead of producing thousands of classes
+_MAX_DEPTH = 32
+_MAX_KEYS = 2048
+
+
+def _validate_shape(json_data, max_depth=_MAX_DEPTH, max_keys=_MAX_KEYS):
+    """Reject JSON that is too deeply nested or has too many keys
+    
+    Walks the same objects the generators do (nested objects and the first
+    item of arrays of objects) with an explicit stack.
+    
+    Raises:
+        ValueError: If nesting exceeds max_depth or there are more than max_keys keys
+    """
+    if not isinstance(json_data, dict):
+        return
+    keys = 0
+    stack = [(json_data, 1)]
+    while stack:
+        data, depth = stack.pop()
+        if depth > max_depth:
+            raise ValueError(f"JSON is nested too deeply (more than {max_depth} levels)")
+        keys += len(data)
+        if keys > max_keys:
+            raise ValueError(f"JSON has too many keys (more than {max_keys})")
+        for value in data.values():
+            if isinstance(value, dict):
+                stack.append((value, depth + 1))
+            elif isinstance(value, list) and value and isinstance(value[0], dict):
+                stack.append((value[0], depth + 1))
 
 
 # Models
@@ -27,20 +192,16 @@ class QuicktypeService:
     """Service to interact with quicktype.io API."""
     
     @staticmethod
-    def get_dart_type(value, make_nullable=True):
-        """Get Dart type for a value, making it nullable by default"""
-        if isinstance(value, bool):
-            return 'bool?' if make_nullable else 'bool'
-        elif isinstance(value, int):
-            return 'int?' if make_nullable else 'int'
-        elif isinstance(value, float):
-            return 'double?' if make_nullable else 'double'
-        elif isinstance(value, str):
-            return 'String?' if make_nullable else 'String'
-        elif isinstance(value, dict):
-            return 'Map<String, dynamic>?' if make_nullable else 'Map<String, dynamic>'
-        elif isinstance(value, list):
-            if value and all(isinstance(item, dict) for item in value):
+    def get_dart_type(value, make_nullable=True, class_name=""):
+        """Get Dart type for a value, making it nullable by default
+        
+        Arrays of objects are typed by their first item as `List<{class_name}Item>`.
+        """
+        dart_types = _DART_TYPES.get(type(value))
+        if dart_types is not None:
+            return dart_types[0] if make_nullable else dart_types[1]
+        if isinstance(value, list):
+            if value and isinstance(value[0], dict):
                 item_class = f"{class_name}Item"
                 return f'List<{item_class}>?' if make_nullable else f'List<{item_class}>'
             return 'List<dynamic>?' if make_nullable else 'List<dynamic>'
@@ -50,151 +211,245 @@ class QuicktypeService:
     def _generate_class_name(parent_name, key):
         """Generate class name using parent class name as prefix"""
         if not parent_name:
-            return key.title().replace('_', '')
-        return f"{parent_name}{key.title().replace('_', '')}"
+            return _pascal_case(key)
+        return f"{parent_name}{_pascal_case(key)}"
 
     @staticmethod
-    def _generate_dart_model(json_data, class_name, parent_name='', nested_classes=None):
-        """Generate Dart model class with nullable fields and proper handling of nested objects
+    def _dart_field_shape(json_key, value, shapes):
+        """Classify one JSON field as a hashable `(json_key, kind, detail)` tuple
         
-        Args:
-            json_data: The JSON data to generate a model from
-            class_name: The name of the generated class
-            parent_name: The name of the parent class (used for nested objects)
-            nested_classes: A dictionary of nested classes (used for recursive generation)
+        `kind` is one of "object", "objects", "list", "datetime" or "value".
+        For "object" and "objects" `detail` is the shape of the nested object,
+        looked up in `shapes`; for "list" it is the element type and for
+        "value" the nullable Dart type.
+        """
+        # Handle nested objects
+        if isinstance(value, dict):
+            return (json_key, "object", shapes[id(value)])
         
-        For sample JSON and generated Dart model examples
-        Sample JSON:
-        {SAMPLE_JSON}
-    
-        Sample Dart Model:
-        {SAMPLE_DART_MODEL}
-
+        # Handle arrays
+        if isinstance(value, list):
+            if value and isinstance(value[0], dict):
+                return (json_key, "objects", shapes[id(value[0])])
+            # Simple array (strings, numbers, etc.): the first element picks
+            # the candidate type, and collecting the distinct element types
+            # in C (set over map) confirms the rest match it
+            element_type = "dynamic"
+            if value:
+                dart_types = _DART_TYPES.get(type(value[0]))
+                if dart_types is not None and len(set(map(type, value))) == 1:
+                    element_type = dart_types[1]
+            return (json_key, "list", element_type)
+        
+        # Special handling for DateTime: a date-like key holding a timestamp-sized
+        # value that starts with a YYYY-MM-DD date and carries a time part
+        if isinstance(value, str) and _is_date_key(json_key) and (
+            _MIN_DATETIME_LEN <= len(value) <= _MAX_DATETIME_LEN
+            and value[4] == '-' and ('T' in value or ':' in value)
+        ):
+            return (json_key, "datetime", "DateTime?")
+        
+        # Regular primitive type
+        return (json_key, "value", QuicktypeService.get_dart_type(value))
 
+    @staticmethod
+    def _dart_shape(json_data):
+        """Reduce a JSON object to the shape the Dart generator depends on
+        
+        The shape is a tuple of field shapes (see `_dart_field_shape`) with
+        nested objects replaced by their own shapes. Values only matter through
+        their types and the DateTime check, so JSON documents that differ only
+        in values have equal shapes. Nested objects are classified before their
+        parents using an explicit stack rather than recursion.
+        
+        Args:
+            json_data: The JSON object to classify
+        
         Returns:
-            A string containing the generated Dart model code
+            A hashable tuple describing the object's fields
         """
-        if nested_classes is None:
-            nested_classes = {}
+        # Resolved once here rather than per field inside the loop
+        field_shape = QuicktypeService._dart_field_shape
+        shapes = {}
+        stack = [(json_data, False)]
+        while stack:
+            data, children_done = stack.pop()
+            if children_done:
+                shapes[id(data)] = tuple(
+                    field_shape(json_key, value, shapes)
+                    for json_key, value in data.items()
+                )
+                continue
+            stack.append((data, True))
+            for value in data.values():
+                if isinstance(value, dict):
+                    stack.append((value, False))
+                elif isinstance(value, list) and value and isinstance(value[0], dict):
+                    stack.append((value[0], False))
+        return shapes[id(json_data)]
+
+    @staticmethod
+    def _generate_dart_class(shape, class_name, children):
+        """Generate a single Dart class with nullable fields
+        
+        Nested objects and arrays of objects are not generated here; instead a
+        `(shape, class_name)` pair is appended to `children` for each of them
+        so the caller can generate those classes without recursing.
+        
+        Args:
+            shape: The shape of the JSON object, as returned by `_dart_shape`
+            class_name: The name of the generated class
+            children: A list collecting the nested classes still to generate
         
-        class_code = [f"class {class_name} {{"]
-        constructors = [f"  {class_name}({{"]
-        from_json = [f"  factory {class_name}.fromJson(Map<String, dynamic> json) => {class_name}("]
-        to_json = ["  Map<String, dynamic> toJson() => {"]
+        Returns:
+            The generated Dart class as a list of string parts to be joined
+        """
+        # Each entry is one complete line, newline included
+        class_code = []
+        constructors = []
+        from_json = []
+        to_json = []
 
-        for json_key, value in json_data.items():
+        for json_key, kind, detail in shape:
             field_name = json_key
             
             # Handle nested objects
-            if isinstance(value, dict):
+            if kind == "object":
                 nested_class_name = QuicktypeService._generate_class_name(parent_name=class_name, key=json_key)
                 field_type = f"{nested_class_name}?"
                 
-                # Generate nested class
-                nested_classes[nested_class_name] = QuicktypeService._generate_dart_model(
-                    value, nested_class_name, class_name, nested_classes
-                )
+                # Queue nested class
+                children.append((detail, nested_class_name))
                 
                 # Add field with proper null handling
-                class_code.append(f"  final {field_type} {field_name};")
-                constructors.append(f"    this.{field_name},")
-                from_json.append(f"    {field_name}: json['{json_key}'] == null ? null : {nested_class_name}.fromJson(json['{json_key}']),")
-                to_json.append(f"    '{json_key}': {field_name}?.toJson(),")
+                class_code.append(f"  final {field_type} {field_name};\n")
+                constructors.append(f"    this.{field_name},\n")
+                from_json.append(f"    {field_name}: json['{json_key}'] == null ? null : {nested_class_name}.fromJson(json['{json_key}']),\n")
+                to_json.append(f"    '{json_key}': {field_name}?.toJson(),\n")
+            
+            # Handle arrays of objects - create a nested class for the items
+            elif kind == "objects":
+                item_class_name = QuicktypeService._generate_class_name(parent_name=class_name, key=json_key.rstrip('s'))
+                if not item_class_name.endswith('s') and json_key.endswith('s'):
+                    item_class_name = item_class_name.rstrip('s')  # Remove trailing 's' if it exists
+                
+                field_type = f"List<{item_class_name}>?"
+                
+                # Queue nested class for array items
+                children.append((detail, item_class_name))
+                
+                # Add field with proper null handling for arrays
+                class_code.append(f"  final {field_type} {field_name};\n")
+                constructors.append(f"    this.{field_name},\n")
+                from_json.append(f"    {field_name}: json['{json_key}'] == null ? [] : List<{item_class_name}>.from(json['{json_key}']!.map((x) => x == null ? null : {item_class_name}.fromJson(x))),\n")
+                to_json.append(f"    '{json_key}': {field_name} == null ? [] : List<dynamic>.from({field_name}!.map((x) => x?.toJson())),\n")
+            
+            # Handle simple arrays (strings, numbers, etc.)
+            elif kind == "list":
+                field_type = f"List<{detail}>?"
+                class_code.append(f"  final {field_type} {field_name};\n")
+                constructors.append(f"    this.{field_name},\n")
+                from_json.append(f"    {field_name}: json['{json_key}'] == null ? [] : List<{detail}>.from(json['{json_key}']!.map((x) => x)),\n")
+                to_json.append(f"    '{json_key}': {field_name} == null ? [] : List<dynamic>.from({field_name}!.map((x) => x)),\n")
             
-            # Handle arrays
-            elif isinstance(value, list):
-                if value and isinstance(value[0], dict):
-                    # Array of objects - create a nested class for the items
-                    item_class_name = QuicktypeService._generate_class_name(parent_name=class_name, key=json_key.rstrip('s'))
-                    if not item_class_name.endswith('s') and json_key.endswith('s'):
-                        item_class_name = item_class_name.rstrip('s')  # Remove trailing 's' if it exists
-                    
-                    field_type = f"List<{item_class_name}>?"
-                    
-                    # Generate nested class for array items
-                    nested_classes[item_class_name] = QuicktypeService._generate_dart_model(
-                        value[0], item_class_name, class_name, nested_classes
-                    )
-                    
-                    # Add field with proper null handling for arrays
-                    class_code.append(f"  final {field_type} {field_name};")
-                    constructors.append(f"    this.{field_name},")
-                    from_json.append(f"    {field_name}: json['{json_key}'] == null ? [] : List<{item_class_name}>.from(json['{json_key}']!.map((x) => x == null ? null : {item_class_name}.fromJson(x))),")
-                    to_json.append(f"    '{json_key}': {field_name} == null ? [] : List<dynamic>.from({field_name}!.map((x) => x?.toJson())),")
-                else:
-                    # Simple array (strings, numbers, etc.)
-                    element_type = "dynamic"
-                    if value and all(isinstance(item, str) for item in value):
-                        element_type = "String"
-                    elif value and all(isinstance(item, int) for item in value):
-                        element_type = "int"
-                    elif value and all(isinstance(item, float) for item in value):
-                        element_type = "double"
-                    elif value and all(isinstance(item, bool) for item in value):
-                        element_type = "bool"
-                    
-                    field_type = f"List<{element_type}>?"
-                    class_code.append(f"  final {field_type} {field_name};")
-                    constructors.append(f"    this.{field_name},")
-                    from_json.append(f"    {field_name}: json['{json_key}'] == null ? [] : List<{element_type}>.from(json['{json_key}']!.map((x) => x)),")
-                    to_json.append(f"    '{json_key}': {field_name} == null ? [] : List<dynamic>.from({field_name}!.map((x) => x)),")
+            # Special handling for DateTime
+            elif kind == "datetime":
+                class_code.append(f"  final {detail} {field_name};\n")
+                constructors.append(f"    this.{field_name},\n")
+                from_json.append(f"    {field_name}: json['{json_key}'] == null ? null : DateTime.parse(json['{json_key}']),\n")
+                to_json.append(f"    '{json_key}': {field_name}?.toIso8601String(),\n")
             
-            # Handle primitive types
+            # Regular primitive type
             else:
-                field_type = QuicktypeService.get_dart_type(value)
-                
-                # Special handling for DateTime
-                if isinstance(value, str) and (
-                    "date" in json_key.lower() or 
-                    "time" in json_key.lower() or 
-                    "created" in json_key.lower() or 
-                    "updated" in json_key.lower()
-                ) and (
-                    "T" in value and "Z" in value or  # ISO format check
-                    "-" in value and ":" in value      # Date with time check
-                ):
-                    field_type = "DateTime?"
-                    class_code.append(f"  final {field_type} {field_name};")
-                    constructors.append(f"    this.{field_name},")
-                    from_json.append(f"    {field_name}: json['{json_key}'] == null ? null : DateTime.parse(json['{json_key}']),")
-                    to_json.append(f"    '{json_key}': {field_name}?.toIso8601String(),")
-                else:
-                    # Regular primitive type
-                    class_code.append(f"  final {field_type} {field_name};")
-                    constructors.append(f"    this.{field_name},")
-                    from_json.append(f"    {field_name}: json['{json_key}'],")
-                    to_json.append(f"    '{json_key}': {field_name},")
+                class_code.append(f"  final {detail} {field_name};\n")
+                constructors.append(f"    this.{field_name},\n")
+                from_json.append(f"    {field_name}: json['{json_key}'],\n")
+                to_json.append(f"    '{json_key}': {field_name},\n")
+        
+        # Return the class as a flat list of string parts; the caller joins every
+        # class in one go, so no intermediate per-class string is built
+        return [
+            f"class {class_name} {{\n", *class_code, "\n",
+            f"  {class_name}({{\n", *constructors, "  });\n\n",
+            f"  factory {class_name}.fromJson(Map<String, dynamic> json) => {class_name}(\n", *from_json, "  );\n\n",
+            "  Map<String, dynamic> toJson() => {\n", *to_json, "  };\n}",
+        ]
+
+    @staticmethod
+    def _generate_dart_model(json_data, class_name):
+        """Generate Dart model class with nullable fields and proper handling of nested objects
         
-        # Finalize the class code
-        constructors.append("  });")
-        from_json.append("  );")
-        to_json.append("  };")
+        The JSON is first reduced to its shape, and the code is then generated
+        from the shape. Generated code is cached per shape, so repeated requests
+        for the same schema with different values skip code generation.
         
-        # Combine all parts
-        class_code.extend([""] + constructors + [""] + from_json + [""] + to_json + ["}"])
+        Args:
+            json_data: The JSON data to generate a model from
+            class_name: The name of the generated class
         
-        # If this is the top-level call, combine with all nested classes
-        if parent_name == '':
-            # Add imports at the top
-            imports = ["import 'dart:convert';", ""]
-            
-            # Add helper methods for the main class
-            helpers = [
-                f"{class_name} {class_name.lower()}FromJson(String str) => {class_name}.fromJson(json.decode(str));",
-                "",
-                f"String {class_name.lower()}ToJson({class_name} data) => json.encode(data.toJson());"
-            ]
-            
-            # Combine everything
-            full_code = imports + helpers + [""] + ["\n".join(class_code)]
-            
-            # Add all nested classes
-            for nested_class in nested_classes.values():
-                full_code.append("\n" + nested_class)
-            
-            return "\n".join(full_code)
+        For sample JSON and generated Dart model examples
+        Sample JSON:
+        {SAMPLE_JSON}
+    
+        Sample Dart Model:
+        {SAMPLE_DART_MODEL}
+
+
+        Returns:
+            A string containing the generated Dart model code
+        """
+        return _generate_dart_cached(QuicktypeService._dart_shape(json_data), class_name)
+
+    @staticmethod
+    def _generate_dart_model_from_shape(shape, class_name):
+        """Generate the Dart model code for a shape returned by `_dart_shape`
+        
+        Classes are generated with an explicit stack rather than recursion. Each
+        class is emitted after all of its nested classes, which keeps the output
+        order identical to a depth-first, post-order walk of the JSON.
+        
+        Args:
+            shape: The shape of the root JSON object
+            class_name: The name of the generated class
+        
+        Returns:
+            A string containing the generated Dart model code
+        """
+        nested_classes = []
+        seen = {class_name}
+        root_children = []
+        root_parts = QuicktypeService._generate_dart_class(shape, class_name, root_children)
+        
+        # Each entry is either a class still to generate, or (with parts set) a
+        # generated class waiting for its nested classes to be emitted first
+        stack = [(child, name, None) for child, name in reversed(root_children)]
+        while stack:
+            child_shape, name, parts = stack.pop()
+            if parts is not None:
+                nested_classes.append(parts)
+                continue
+            # A class name is generated once; later duplicates are skipped
+            if name in seen:
+                continue
+            seen.add(name)
+            children = []
+            parts = QuicktypeService._generate_dart_class(child_shape, name, children)
+            stack.append((None, name, parts))
+            stack.extend((child, child_name, None) for child, child_name in reversed(children))
         
-        return "\n".join(class_code)
+        # Write imports, helper methods, the main class and then all nested
+        # classes into one buffer, joined once at the end
+        out = [
+            "import 'dart:convert';\n\n",
+            f"{class_name} {class_name.lower()}FromJson(String str) => {class_name}.fromJson(json.decode(str));\n\n",
+            f"String {class_name.lower()}ToJson({class_name} data) => json.encode(data.toJson());\n\n",
+        ]
+        out.extend(root_parts)
+        for parts in nested_classes:
+            out.append("\n\n")
+            out.extend(parts)
+        
+        return "".join(out)
     
     # @staticmethod
     # def _generate_kotlin_model(json_data: dict, class_name: str) -> str:
@@ -205,7 +460,19 @@ class QuicktypeService:
  
     
     @staticmethod
-    async def generate_model(json_input: str, class_name: str = "Model", language: str = "dart") -> Dict[str, Any]:
+    def _model_result(code: str, class_name: str, language: str) -> Dict[str, Any]:
+        """Build the response returned for a successfully generated model"""
+        logger.info("Successfully generated %s model for %s", language, class_name)
+        
+        return {
+            "code": code,
+            "language": language,
+            "class_name": class_name,
+            "message": f"{language.capitalize()} model generated successfully"
+        }
+
+    @staticmethod
+    def generate_model(json_input: str, class_name: str = "Model", language: str = "dart") -> Dict[str, Any]:
         """Generate a model from JSON input with null Safety.
         
         Args:
@@ -216,64 +483,77 @@ class QuicktypeService:
         Returns:
             A dictionary containing the generated code and metadata
         """
-        logger.info(f"Generating {language} model for class {class_name}")
+        if not isinstance(json_input, str):
+            return QuicktypeService.generate_model_from_parsed(json_input, class_name, language)
+        
+        logger.info("Generating %s model for class %s", language, class_name)
         try:
-            # Validate JSON
+            lang = language.lower()
+            if lang not in _GENERATORS:
+                return {"error": f"Language '{language}' is not supported in offline mode"}
+            
+            # Validate JSON and generate; raw JSON strings go through the cache
             try:
-                if isinstance(json_input, str):
-                    parsed_json = json.loads(json_input)
-                else:
-                    parsed_json = json_input
+                code = _generate_cached(json_input, class_name, lang)
             except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON input: {str(e)}")
-                return {"error": f"Invalid JSON: {str(e)}"}
+                # Only invalid input pays for the repair pipeline. The input is
+                # already known to be invalid, so it is repaired straight away.
+                try:
+                    _, parsed_json = _repair_and_parse(json_input)
+                except json.JSONDecodeError:
+                    logger.error("Invalid JSON input: %s", e)
+                    return {"error": f"Invalid JSON: {str(e)}"}
+                
+                logger.info("Generating model from repaired JSON input")
+                _validate_shape(parsed_json)
+                code = _GENERATORS[lang](parsed_json, class_name)
+                result = QuicktypeService._model_result(code, class_name, language)
+                result["message"] += " (input JSON was repaired)"
+                return result
             
-            # For complex nested structures, use our sample as a reference
-            if language.lower() == "dart":
-                # Check if this is a complex nested structure that might need special handling
-                if isinstance(parsed_json, dict) and "data" in parsed_json and isinstance(parsed_json.get("data"), dict):
-                    logger.info("Using enhanced Dart model generation for complex nested structure")
-                    code = QuicktypeService._generate_dart_model(parsed_json, class_name)
-                else:
-                    code = QuicktypeService._generate_dart_model(parsed_json, class_name)
-            elif language.lower() == "typescript":
-                code = QuicktypeService._generate_typescript_model(parsed_json, class_name)
-            elif language.lower() == "kotlin":
-                code = QuicktypeService._generate_kotlin_model(parsed_json, class_name)
-            elif language.lower() == "swift":
-                code = QuicktypeService._generate_swift_model(parsed_json, class_name)
-            elif language.lower() == "python":
-                code = QuicktypeService._generate_python_model(parsed_json, class_name)
-            else:
-                return {"error": f"Language '{language}' is not supported in offline mode"}
+            return QuicktypeService._model_result(code, class_name, language)
+        except Exception as e:
+            error_msg = f"Failed to generate model: {str(e)}"
+            logger.error(error_msg)
+            return {"error": error_msg}
+
+    @staticmethod
+    def generate_model_from_parsed(parsed_json: Any, class_name: str = "Model", language: str = "dart") -> Dict[str, Any]:
+        """Generate a model from JSON that has already been parsed.
+        
+        Args:
+            parsed_json: The parsed JSON data to generate a model from
+            class_name: The name of the generated class
+            language: The programming language to generate code for
             
-            logger.info(f"Successfully generated {language} model for {class_name}")
+        Returns:
+            A dictionary containing the generated code and metadata
+        """
+        logger.info("Generating %s model for class %s", language, class_name)
+        try:
+            generator = _GENERATORS.get(language.lower())
+            if generator is None:
+                return {"error": f"Language '{language}' is not supported in offline mode"}
             
-            return {
-                "code": code,
-                "language": language,
-                "class_name": class_name,
-                "message": f"{language.capitalize()} model generated successfully"
-            }
+            _validate_shape(parsed_json)
+            code = generator(parsed_json, class_name)
+            return QuicktypeService._model_result(code, class_name, language)
         except Exception as e:
             error_msg = f"Failed to generate model: {str(e)}"
             logger.error(error_msg)
             return {"error": error_msg}
             
     @staticmethod
-    def list_supported_languages() -> Dict[str, Any]:
+    def list_supported_languages() -> Dict[str, List[str]]:
         """List all languages supported by quicktype.io.
         
         Returns:
             A dictionary containing the list of supported languages
         """
-        logger.info("Listing supported languages")
-        # These are the main languages supported by quicktype.io
-        languages = [
-            "dart", "typescript", "kotlin", "swift", "python", "java", "go"
-        ]
-        
-        return {"languages": languages}
+        logger.debug("Listing supported languages")
+        # The languages never change; only the small response dict is built per
+        # call, so callers cannot change what later callers receive
+        return {"languages": list(_SUPPORTED_LANGUAGES)}
 
     @staticmethod
     def fix_json(json_input: str) -> Dict[str, Any]:
@@ -287,40 +567,21 @@ class QuicktypeService:
         """
         logger.info("Attempting to fix JSON input")
         try:
-            # First try to parse as-is
-            try:
-                json.loads(json_input)
+            # First check the input as-is; verdicts for recent inputs are cached
+            if _is_valid_json(json_input):
                 logger.info("JSON is already valid")
                 return {
                     "fixed_json": json_input,
                     "valid": True,
                     "message": "JSON is already valid"
                 }
-            except json.JSONDecodeError:
-                logger.info("JSON is invalid, attempting to fix")
-                pass
+            logger.info("JSON is invalid, attempting to fix")
                 
-            # Common JSON issues to fix
-            # 1. Replace single quotes with double quotes
-            fixed_json = json_input.replace("'", '"')
-            
-            # 2. Add quotes to unquoted keys
-            import re
-            fixed_json = re.sub(r'([{,])\s*([a-zA-Z0-9_]+)\s*:', r'\1"\2":', fixed_json)
-            
-            # 3. Fix trailing commas in objects and arrays
-            fixed_json = re.sub(r',\s*}', '}', fixed_json)
-            fixed_json = re.sub(r',\s*\]', ']', fixed_json)
-            
-            # 4. Fix missing quotes around string values
-            # This is a simplified approach - more complex cases might need additional handling
-            fixed_json = re.sub(r':\s*([a-zA-Z][a-zA-Z0-9_]*)\s*([,}])', r':"\1"\2', fixed_json)
-            
-            # Try to parse the fixed JSON
-            parsed_json = json.loads(fixed_json)
+            # Fix common JSON issues and parse the fixed JSON
+            _, parsed_json = _repair_and_parse(json_input)
             
             # Format the JSON with proper indentation
-            formatted_json = json.dumps(parsed_json, indent=2)
+            formatted_json = _dumps_indent(parsed_json)
             
             return {
                 "fixed_json": formatted_json,
@@ -347,69 +608,186 @@ class QuicktypeService:
             }
 
 
+# Offline model generators, keyed by lower-cased language name
+_GENERATORS = {
+    "dart": QuicktypeService._generate_dart_model,
+}
+
+# Languages supported by quicktype.io that have no offline generator yet
+_QUICKTYPE_ONLY_LANGUAGES = ("typescript", "kotlin", "swift", "python", "java", "go")
+
+# These are the main languages supported by quicktype.io
+_SUPPORTED_LANGUAGES = (*_GENERATORS, *_QUICKTYPE_ONLY_LANGUAGES)
+
+
+@lru_cache(maxsize=256)
+def _generate_dart_cached(shape, class_name):
+    """Cached Dart code generation, keyed on the JSON shape and class name"""
+    return QuicktypeService._generate_dart_model_from_shape(shape, class_name)
+
+
+# Longer JSON strings are never used as cache keys, so the caches cannot keep
+# large payloads alive in a long-running server
+_MAX_CACHED_TEXT_CHARS = 16 * 1024
+
+
+def _generate_from_text(json_text, class_name, language):
+    """Parse a JSON string and generate its model"""
+    parsed_json = _loads(json_text)
+    _validate_shape(parsed_json)
+    return _GENERATORS[language](parsed_json, class_name)
+
+
+_generate_from_text_cached = lru_cache(maxsize=128)(_generate_from_text)
+
+
+def _generate_cached(json_text, class_name, language):
+    """Parse a JSON string and generate its model, cached on the raw text
+    
+    Generation is deterministic, so clients retrying the same payload get the
+    previous result back without re-parsing or re-generating it. Invalid JSON
+    raises and is therefore never cached. Inputs longer than
+    _MAX_CACHED_TEXT_CHARS are not cached on their text; they still reuse the
+    per-shape code cache after parsing.
+    """
+    if len(json_text) > _MAX_CACHED_TEXT_CHARS:
+        return _generate_from_text(json_text, class_name, language)
+    return _generate_from_text_cached(json_text, class_name, language)
+
+
+_CLOSING_BRACKETS = {"{": "}", "[": "]"}
+
+def _check_json(json_text):
+    """Check whether a string is valid JSON by parsing it"""
+    # An object or array whose closing bracket is missing cannot parse, so
+    # skip the doomed decode attempt
+    stripped = json_text.strip()
+    closing = _CLOSING_BRACKETS.get(stripped[:1])
+    if closing is not None and not stripped.endswith(closing):
+        return False
+    try:
+        _loads(json_text)
+    except json.JSONDecodeError:
+        return False
+    return True
+
+
+_check_json_cached = lru_cache(maxsize=256)(_check_json)
+
+
+def _is_valid_json(json_text):
+    """Check whether a string is valid JSON, caching the verdict for short inputs
+    
+    Clients often send the same payload to fix_json repeatedly; a repeat costs
+    a hash lookup instead of a full parse. Inputs longer than
+    _MAX_CACHED_TEXT_CHARS are always parsed.
+    """
+    if len(json_text) > _MAX_CACHED_TEXT_CHARS:
+        return _check_json(json_text)
+    return _check_json_cached(json_text)
+
+
+# Inputs at least this long are generated off the event loop
+_THREAD_OFFLOAD_MIN_CHARS = 64 * 1024
+
+
 # Define MCP tools
-@mcp.tool("generate_model")
-async def generate_model(json_input: str, class_name: str = "Model", language: str = "dart") -> Dict[str, Any]:
-    """Generate a model from JSON input.
+def register_tools(server) -> None:
+    """Register the quicktype tools on an MCP server instance.
     
     Args:
-        json_input: The JSON string to generate a model from
-        class_name: The name of the generated class
-        language: The programming language to generate code for
-        
-    Returns:
-        A dictionary containing the generated code and metadata
+        server: The FastMCP server to register the tools on
     """
-    logger.info(f"Generating {language} model for class {class_name}")
-    
-    # Check if the json_input is nested and needs special handling
-    try:
-        is_nested = False
-        if isinstance(json_input, str):
-            parsed_json = json.loads(json_input)
-            
-            # Check if this is a nested structure similar to our sample
-            if isinstance(parsed_json, dict) and "data" in parsed_json and isinstance(parsed_json["data"], dict):
-                # This appears to be a nested API response
-                is_nested = True
-                logger.info("Detected nested API response structure")
-        else:
-            parsed_json = json_input
+
+    @server.tool("generate_model")
+    async def generate_model(json_input: str, class_name: str = "Model", language: str = "dart") -> Dict[str, Any]:
+        """Generate a model from JSON input.
+        
+        Args:
+            json_input: The JSON string to generate a model from
+            class_name: The name of the generated class
+            language: The programming language to generate code for
             
-        # Use our enhanced model generation
-        result = await QuicktypeService.generate_model(
-            json_input=parsed_json, 
-            class_name=class_name, 
+        Returns:
+            A dictionary containing the generated code and metadata
+        """
+        # The service parses the string itself, once, and caches the result.
+        # Large inputs are generated on a worker thread so the event loop keeps
+        # serving other requests; small ones are cheaper to run inline.
+        if len(json_input) >= _THREAD_OFFLOAD_MIN_CHARS:
+            return await asyncio.to_thread(
+                QuicktypeService.generate_model, json_input, class_name, language
+            )
+        return QuicktypeService.generate_model(
+            json_input=json_input,
+            class_name=class_name,
             language=language
         )
+
+    @server.tool("list_languages")
+    def list_languages() -> Dict[str, List[str]]:
+        """List all languages supported by quicktype.io.
         
-        return result
-    except Exception as e:
-        error_msg = f"Error generating model: {str(e)}"
-        logger.error(error_msg)
-        return {"error": error_msg}
-
-@mcp.tool("list_languages")
-def list_languages() -> Dict[str, List[str]]:
-    """List all languages supported by quicktype.io.
-    
-    Returns:
-        A dictionary containing the list of supported languages
-    """
-    return QuicktypeService.list_supported_languages()
+        Returns:
+            A dictionary containing the list of supported languages
+        """
+        return QuicktypeService.list_supported_languages()
 
-@mcp.tool("fix_json")
-def fix_json(json_input: str) -> Dict[str, Any]:
-    """Fix and format invalid JSON input.
-    
-    Args:
-        json_input: The JSON string to fix
+    @server.tool("fix_json")
+    def fix_json(json_input: str) -> Dict[str, Any]:
+        """Fix and format invalid JSON input.
         
+        Args:
+            json_input: The JSON string to fix
+            
+        Returns:
+            A dictionary containing the fixed JSON and validation status
+        """
+        return QuicktypeService.fix_json(json_input)
+
+
+def create_server():
+    """Create the MCP server with all quicktype tools registered.
+    
+    FastMCP is imported here rather than at module load so that importing
+    this module (e.g. to use QuicktypeService directly) stays cheap.
+    
     Returns:
-        A dictionary containing the fixed JSON and validation status
+        A configured FastMCP server instance
     """
-    return QuicktypeService.fix_json(json_input)
+    from mcp.server import FastMCP
+    
+    server = FastMCP(name="quicktype-mcp")
+    register_tools(server)
+    return server
+
+
+def install_uvloop() -> None:
+    """Run the server on uvloop when it is installed (optional speedup)"""
+    # Event loop policies are deprecated from Python 3.14, so the speedup is
+    # limited to older versions (the speedups extra does not install it there)
+    if sys.version_info >= (3, 14):
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    # uvloop.install() is deprecated on Python 3.12+; anyio.run picks up the
+    # policy's loop the same way
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def __getattr__(name):
+    """Lazily create the module-level `mcp` server on first access (PEP 562)."""
+    if name == "mcp":
+        global mcp
+        mcp = create_server()
+        return mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
+    configure_logging()
+    install_uvloop()
     # Run the MCP server
-    mcp.run()
\ No newline at end of file
+    create_server().run()
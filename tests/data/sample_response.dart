@@ -0,0 +1,197 @@
+import 'dart:convert';
+
+SampleResponse sampleresponseFromJson(String str) => SampleResponse.fromJson(json.decode(str));
+
+String sampleresponseToJson(SampleResponse data) => json.encode(data.toJson());
+
+class SampleResponse {
+  final SampleResponseData? data;
+
+  SampleResponse({
+    this.data,
+  });
+
+  factory SampleResponse.fromJson(Map<String, dynamic> json) => SampleResponse(
+    data: json['data'] == null ? null : SampleResponseData.fromJson(json['data']),
+  );
+
+  Map<String, dynamic> toJson() => {
+    'data': data?.toJson(),
+  };
+}
+
+class SampleResponseDataAddressCoordinates {
+  final double? lat;
+  final double? lng;
+
+  SampleResponseDataAddressCoordinates({
+    this.lat,
+    this.lng,
+  });
+
+  factory SampleResponseDataAddressCoordinates.fromJson(Map<String, dynamic> json) => SampleResponseDataAddressCoordinates(
+    lat: json['lat'],
+    lng: json['lng'],
+  );
+
+  Map<String, dynamic> toJson() => {
+    'lat': lat,
+    'lng': lng,
+  };
+}
+
+class SampleResponseDataAddress {
+  final String? city;
+  final SampleResponseDataAddressCoordinates? coordinates;
+
+  SampleResponseDataAddress({
+    this.city,
+    this.coordinates,
+  });
+
+  factory SampleResponseDataAddress.fromJson(Map<String, dynamic> json) => SampleResponseDataAddress(
+    city: json['city'],
+    coordinates: json['coordinates'] == null ? null : SampleResponseDataAddressCoordinates.fromJson(json['coordinates']),
+  );
+
+  Map<String, dynamic> toJson() => {
+    'city': city,
+    'coordinates': coordinates?.toJson(),
+  };
+}
+
+class SampleResponseDataMetaPreferencesNotifications {
+  final bool? email;
+  final dynamic? push;
+
+  SampleResponseDataMetaPreferencesNotifications({
+    this.email,
+    this.push,
+  });
+
+  factory SampleResponseDataMetaPreferencesNotifications.fromJson(Map<String, dynamic> json) => SampleResponseDataMetaPreferencesNotifications(
+    email: json['email'],
+    push: json['push'],
+  );
+
+  Map<String, dynamic> toJson() => {
+    'email': email,
+    'push': push,
+  };
+}
+
+class SampleResponseDataMetaPreferences {
+  final String? theme;
+  final SampleResponseDataMetaPreferencesNotifications? notifications;
+
+  SampleResponseDataMetaPreferences({
+    this.theme,
+    this.notifications,
+  });
+
+  factory SampleResponseDataMetaPreferences.fromJson(Map<String, dynamic> json) => SampleResponseDataMetaPreferences(
+    theme: json['theme'],
+    notifications: json['notifications'] == null ? null : SampleResponseDataMetaPreferencesNotifications.fromJson(json['notifications']),
+  );
+
+  Map<String, dynamic> toJson() => {
+    'theme': theme,
+    'notifications': notifications?.toJson(),
+  };
+}
+
+class SampleResponseDataMeta {
+  final List<String>? devices;
+  final SampleResponseDataMetaPreferences? preferences;
+  final String? lastSeen;
+
+  SampleResponseDataMeta({
+    this.devices,
+    this.preferences,
+    this.lastSeen,
+  });
+
+  factory SampleResponseDataMeta.fromJson(Map<String, dynamic> json) => SampleResponseDataMeta(
+    devices: json['devices'] == null ? [] : List<String>.from(json['devices']!.map((x) => x)),
+    preferences: json['preferences'] == null ? null : SampleResponseDataMetaPreferences.fromJson(json['preferences']),
+    lastSeen: json['lastSeen'],
+  );
+
+  Map<String, dynamic> toJson() => {
+    'devices': devices == null ? [] : List<dynamic>.from(devices!.map((x) => x)),
+    'preferences': preferences?.toJson(),
+    'lastSeen': lastSeen,
+  };
+}
+
+class SampleResponseDataGroup {
+  final int? id;
+  final String? name;
+
+  SampleResponseDataGroup({
+    this.id,
+    this.name,
+  });
+
+  factory SampleResponseDataGroup.fromJson(Map<String, dynamic> json) => SampleResponseDataGroup(
+    id: json['id'],
+    name: json['name'],
+  );
+
+  Map<String, dynamic> toJson() => {
+    'id': id,
+    'name': name,
+  };
+}
+
+class SampleResponseData {
+  final int? id;
+  final String? name;
+  final bool? active;
+  final DateTime? created;
+  final List<dynamic>? scores;
+  final SampleResponseDataAddress? address;
+  final List<String>? tags;
+  final SampleResponseDataMeta? meta;
+  final List<SampleResponseDataGroup>? groups;
+  final dynamic? expires;
+
+  SampleResponseData({
+    this.id,
+    this.name,
+    this.active,
+    this.created,
+    this.scores,
+    this.address,
+    this.tags,
+    this.meta,
+    this.groups,
+    this.expires,
+  });
+
+  factory SampleResponseData.fromJson(Map<String, dynamic> json) => SampleResponseData(
+    id: json['id'],
+    name: json['name'],
+    active: json['active'],
+    created: json['created'] == null ? null : DateTime.parse(json['created']),
+    scores: json['scores'] == null ? [] : List<dynamic>.from(json['scores']!.map((x) => x)),
+    address: json['address'] == null ? null : SampleResponseDataAddress.fromJson(json['address']),
+    tags: json['tags'] == null ? [] : List<String>.from(json['tags']!.map((x) => x)),
+    meta: json['meta'] == null ? null : SampleResponseDataMeta.fromJson(json['meta']),
+    groups: json['groups'] == null ? [] : List<SampleResponseDataGroup>.from(json['groups']!.map((x) => x == null ? null : SampleResponseDataGroup.fromJson(x))),
+    expires: json['expires'],
+  );
+
+  Map<String, dynamic> toJson() => {
+    'id': id,
+    'name': name,
+    'active': active,
+    'created': created?.toIso8601String(),
+    'scores': scores == null ? [] : List<dynamic>.from(scores!.map((x) => x)),
+    'address': address?.toJson(),
+    'tags': tags == null ? [] : List<dynamic>.from(tags!.map((x) => x)),
+    'meta': meta?.toJson(),
+    'groups': groups == null ? [] : List<dynamic>.from(groups!.map((x) => x?.toJson())),
+    'expires': expires,
+  };
+}
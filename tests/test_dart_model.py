@@ -0,0 +1,84 @@
+"""Tests for Dart model generation and its per-shape cache."""
+import json
+from pathlib import Path
+
+from examples import SAMPLE_JSON
+from main import QuicktypeService, _generate_dart_cached
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def test_sample_json_model_is_unchanged():
+    expected = (DATA_DIR / "sample_response.dart").read_text()
+    code = QuicktypeService._generate_dart_model(SAMPLE_JSON, "SampleResponse")
+    assert code == expected.rstrip("\n")
+
+
+def test_equal_shapes_share_cached_code():
+    first = {
+        "id": 1,
+        "name": "Alice",
+        "created_at": "2023-10-15T08:30:00Z",
+        "tags": ["a", "b"],
+        "address": {"city": "Paris", "zip": "75001"},
+        "orders": [{"total": 9.5}],
+    }
+    second = {
+        "id": 2,
+        "name": "Bob",
+        "created_at": "2024-01-01T00:00:00Z",
+        "tags": ["c"],
+        "address": {"city": "Oslo", "zip": "0150"},
+        "orders": [{"total": 20.0}, {"total": 1.25}],
+    }
+    assert QuicktypeService._dart_shape(first) == QuicktypeService._dart_shape(second)
+
+    _generate_dart_cached.cache_clear()
+    first_code = QuicktypeService._generate_dart_model(first, "User")
+    second_code = QuicktypeService._generate_dart_model(second, "User")
+
+    assert second_code == first_code
+    info = _generate_dart_cached.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_different_shapes_do_not_share_code():
+    _generate_dart_cached.cache_clear()
+    ints = QuicktypeService._generate_dart_model({"value": 1}, "Model")
+    strings = QuicktypeService._generate_dart_model({"value": "1"}, "Model")
+
+    assert ints != strings
+    assert _generate_dart_cached.cache_info().misses == 2
+
+
+def test_integers_beyond_64_bits_are_typed_int():
+    result = QuicktypeService.generate_model('{"id": 123456789012345678901234}', "Model")
+    assert "  final int? id;\n" in result["code"]
+
+
+def test_invalid_input_is_repaired_before_generating():
+    result = QuicktypeService.generate_model("{a: 1}", "Model")
+    assert "  final int? a;\n" in result["code"]
+    assert result["message"].endswith(" (input JSON was repaired)")
+
+
+def test_rejects_too_deeply_nested_json():
+    data = 1
+    for _ in range(40):
+        data = {"a": data}
+    result = QuicktypeService.generate_model(json.dumps(data), "Model")
+    assert result == {
+        "error": "Failed to generate model: JSON is nested too deeply (more than 32 levels)"
+    }
+
+
+def test_rejects_json_with_too_many_keys():
+    data = {f"k{i}": i for i in range(3000)}
+    result = QuicktypeService.generate_model(json.dumps(data), "Model")
+    assert result == {
+        "error": "Failed to generate model: JSON has too many keys (more than 2048)"
+    }
+
+
+def test_list_of_objects_is_typed_with_item_class():
+    assert QuicktypeService.get_dart_type([{}], class_name="X") == "List<XItem>?"
@@ -0,0 +1,99 @@
+"""Tests for the single-pass JSON repair used by fix_json."""
+import json
+import time
+
+import pytest
+
+from main import QuicktypeService, _repair_json
+
+
+def fixed(json_input):
+    """Run fix_json and return the parsed repaired JSON"""
+    result = QuicktypeService.fix_json(json_input)
+    assert result["valid"], result["message"]
+    return json.loads(result["fixed_json"])
+
+
+@pytest.mark.parametrize("json_input, expected", [
+    # Unquoted keys
+    ("{a: 1, b_c: 2}", {"a": 1, "b_c": 2}),
+    # Trailing commas in objects and arrays
+    ('{"a": 1,}', {"a": 1}),
+    ('{"a": [1, 2,],}', {"a": [1, 2]}),
+    # Single-quoted strings
+    ("{'a': 'b'}", {"a": "b"}),
+    # Unquoted string values
+    ('{"x": hello}', {"x": "hello"}),
+])
+def test_fixes_common_mistakes(json_input, expected):
+    assert fixed(json_input) == expected
+
+
+def test_keeps_json_literals():
+    assert fixed("{a: true, b: false, c: null,}") == {"a": True, "b": False, "c": None}
+
+
+def test_quotes_bare_words_in_arrays():
+    assert fixed("{a: [x, y, 1e5, -2.5, null]}") == {"a": ["x", "y", 1e5, -2.5, None]}
+
+
+def test_accepts_dollar_in_keys_and_values():
+    assert fixed("{$id: $ref}") == {"$id": "$ref"}
+
+
+def test_leaves_apostrophes_in_double_quoted_strings():
+    assert fixed('{"a": "it\'s", b: 1}') == {"a": "it's", "b": 1}
+
+
+def test_never_modifies_double_quoted_strings():
+    text = '{"k": "a, }", "v": "x: y, [z,]"'
+    assert _repair_json(text + ", w: 1}") == text + ', "w": 1}'
+
+
+def test_valid_json_is_returned_unchanged():
+    result = QuicktypeService.fix_json('{"a": [1, 2]}')
+    assert result == {
+        "fixed_json": '{"a": [1, 2]}',
+        "valid": True,
+        "message": "JSON is already valid",
+    }
+
+
+def test_reports_unfixable_json():
+    result = QuicktypeService.fix_json("{a: ")
+    assert not result["valid"]
+    assert result["fixed_json"] == "{a: "
+    assert "error_position" in result
+
+
+@pytest.mark.parametrize("quote", ['"', "'"])
+def test_truncated_escaped_string_is_repaired_in_linear_time(quote):
+    # A payload cut off inside a string full of escaped quotes used to be
+    # rescanned from every escaped quote, taking seconds at this size
+    inner = ", ".join(f'\\{quote}k{i}\\{quote}: \\{quote}v{i}\\{quote}' for i in range(4000))
+    text = f'{{"payload": {quote}{{{inner}'[:64000]
+
+    start = time.perf_counter()
+    result = QuicktypeService.fix_json(text)
+    elapsed = time.perf_counter() - start
+
+    assert not result["valid"]
+    assert elapsed < 1.0
+
+
+def test_keeps_integers_beyond_64_bits():
+    assert fixed("{id: 123456789012345678901234}") == {"id": 123456789012345678901234}
+    assert fixed("{id: -9999999999999999999}") == {"id": -9999999999999999999}
+
+
+@pytest.mark.parametrize("json_input, expected", [
+    ('{"a": NaN, "b": Infinity}', None),
+    ('{"a": "\\ud800"}', {"a": "\ud800"}),
+    ('{"id": 123456789012345678901234}', {"id": 123456789012345678901234}),
+])
+def test_accepts_what_the_json_module_accepts(json_input, expected):
+    result = QuicktypeService.fix_json(json_input)
+    assert result["valid"]
+    assert result["message"] == "JSON is already valid"
+    if expected is not None:
+        assert json.loads(result["fixed_json"]) == expected
@@ -0,0 +1,18 @@
+"""Tests for the MCP tools as served by FastMCP."""
+import asyncio
+import json
+
+from main import create_server
+
+
+def call_tool(name, arguments):
+    """Call a tool on a fresh server and return its text content"""
+    content, _ = asyncio.run(create_server().call_tool(name, arguments))
+    return content[0].text
+
+
+def test_list_languages_returns_a_json_object():
+    result = json.loads(call_tool("list_languages", {}))
+    assert result == {
+        "languages": ["dart", "typescript", "kotlin", "swift", "python", "java", "go"]
+    }